@@ -11,13 +11,19 @@
 
 """Univariate polynomials with rational coefficients."""
 
-__all__ = ['Polynomial']
+__all__ = ['Polynomial', 'ModularReducer', 'PowerSeries', 'EvalCache']
 
+from collections import OrderedDict, namedtuple
 from fractions import Fraction
-from itertools import dropwhile, chain, repeat, product
+from itertools import (chain, combinations, dropwhile, islice, product,
+                       repeat)
+from math import gcd, isqrt, lcm
 from numbers import Rational
 from operator import add, sub
-from typing import Union
+from random import Random
+import re
+from threading import Lock
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple, Union
 
 try:
     from typing import Self
@@ -50,7 +56,7 @@ class Polynomial:
     >>> str(g)
     'f(x) = ¹/₂⋅x⁵ + ¹/₄⋅x + 3'
     """
-    __slots__ = '_coeffs'
+    __slots__ = ('_coeffs', '_factors', '_hash')
 
     def __init__(self, *args: Rational) -> None:
         """
@@ -84,6 +90,8 @@ class Polynomial:
 
         Two polynomials are considered equal if their coefficients are equal.
         """
+        if not isinstance(other, Polynomial):
+            return NotImplemented
         return self._coeffs == other._coeffs
 
     def __gt__(self, other: Self) -> bool:
@@ -106,7 +114,13 @@ class Polynomial:
 
     def __hash__(self) -> int:
         """hash(self)"""
-        return hash(self._coeffs)
+        # Hashing the coefficients is costly for higher degrees, so the
+        # hash is computed once and memoized.
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = h = hash(self._coeffs)
+            return h
 
     def __copy__(self) -> Self:
         """copy(self)"""
@@ -133,41 +147,174 @@ class Polynomial:
 
     __call__ = eval
 
+    def eval_at(self, points: Iterable[Rational]) -> List[Rational]:
+        """
+        Evaluates the polynomial at each of the given `points`.
+
+        For integer and fractional points the evaluation is done in integer
+        arithmetic: the coefficients are brought to a common denominator
+        once, qⁿ⋅f(p/q) is evaluated by Horner's method for each point p/q
+        and the result is normalized by a single division. This avoids the
+        normalization of intermediate fractions, which dominates the cost of
+        evaluating the polynomial point by point.
+
+        Args:
+            points: The values to evaluate the polynomial at
+
+        Returns:
+            [f(x) for x in points]
+        """
+        coeffs = self._coeffs
+        if not coeffs:
+            return [0 for _ in points]
+        if len(coeffs) == 1:
+            return [coeffs[0] for _ in points]
+        if any(type(c) not in (int, Fraction) for c in coeffs):
+            return [self.eval(x) for x in points]
+        den = lcm(*(c.denominator for c in coeffs))
+        ints = [c.numerator * (den // c.denominator) for c in coeffs]
+        is_int = den == 1 and all(type(c) is int for c in coeffs)
+        n = len(ints) - 1
+        res = []
+        for x in points:
+            if type(x) is int or type(x) is Fraction and x.denominator == 1:
+                p = x.numerator
+                fx = 0
+                for c in ints:
+                    fx = fx * p + c
+                res.append(fx if is_int and type(x) is int
+                           else Fraction(fx, den))
+            elif type(x) is Fraction:
+                p, q = x.numerator, x.denominator
+                fx = 0
+                qk = 1
+                for c in ints:
+                    fx = fx * p + c * qk
+                    qk *= q
+                res.append(Fraction(fx, den * q ** n))
+            else:
+                res.append(self.eval(x))
+        return res
+
     def __repr__(self) -> str:
         """repr(self)"""
         return "%s(%s)" % (self.__class__.__name__,
                            ", ".join(repr(c) for c in self._coeffs))
 
-    def _term(self, i: int) -> str:
-        c = self._coeffs[i]
-        if c == 0:
-            return ""
-        if i == 0:
-            s = '' if c > 0 else '-'
-        else:
-            s = " + " if c > 0 else " - "
-        c = abs(c)
-        e = self.degree() - i
-        if e == 0:
-            return f"{s}{_to_str(c)}"
-        if c == 1:
-            x = "x"
-        else:
-            x = f"{_to_str(c)}⋅x"
-        if e == 1:
-            return f"{s}{x}"
-        else:
-            return f"{s}{x}{str(e).translate(_to_superscript)}"
+    def _iter_str(self, ascii: bool = False) -> Iterator[str]:
+        """Iterate over the parts of the string representation."""
+        yield "f(x) = "
+        n = len(self._coeffs)
+        if n == 0:
+            yield "0"
+            return
+        yield from _iter_terms(zip(range(n - 1, -1, -1), self._coeffs),
+                               ascii)
 
     def __str__(self) -> str:
         """str(self)"""
-        n = len(self._coeffs)
-        if n == 0:
-            return "f(x) = 0"
-        s = "f(x) = "
-        for i in range(n):
-            s += self._term(i)
-        return s
+        return "".join(self._iter_str())
+
+    def write(self, file: TextIO, ascii: bool = False) -> None:
+        """
+        Writes the string representation of the polynomial to `file`.
+
+        The output is generated term by term and written in chunks, so that
+        the full string is never built in memory.
+
+        Args:
+            file: A file-like object with a `write` method accepting str
+            ascii: If True, the output uses only ASCII characters (i. e.
+                "1/2*x^3" instead of "¹/₂⋅x³")
+
+        Examples
+        ========
+        >>> import sys
+        >>> Polynomial(Fraction(1, 2), 0, -7, 4).write(sys.stdout, ascii=True)
+        f(x) = 1/2*x^3 - 7*x + 4
+        """
+        parts = self._iter_str(ascii)
+        while True:
+            chunk = "".join(islice(parts, _WRITE_CHUNK_SIZE))
+            if not chunk:
+                break
+            file.write(chunk)
+
+    @classmethod
+    def parse(cls, s: str) -> Self:
+        """
+        Creates a polynomial from its string representation.
+
+        Both the form returned by `str` (i. e. "f(x) = ¹/₂⋅x³ - 7⋅x + 4") and
+        a plain ASCII form (i. e. "1/2*x^3 - 7*x + 4" or "1/2x**3 - 7x + 4")
+        are accepted. The prefix "f(x) =" is optional; terms may be given in
+        any order and terms with equal exponents are added.
+
+        Args:
+            s: The string to parse
+
+        Returns:
+            The polynomial represented by `s`
+
+        Raises:
+            ValueError: If `s` is not a valid representation of a polynomial.
+
+        Examples
+        ========
+        >>> Polynomial.parse("f(x) = ¹/₂⋅x³ - 7⋅x + 4")
+        Polynomial(Fraction(1, 2), 0, -7, 4)
+        >>> Polynomial.parse("3 - x^2 + 2*x^2")
+        Polynomial(1, 0, 3)
+        """
+        m = _PREFIX_RE.match(s)
+        pos = m.end()
+        end = len(s.rstrip())
+        terms = {}
+        while True:
+            m = _TERM_RE.match(s, pos)
+            sign, num, den, unum, uden, mul, x, exp, uexp = m.groups()
+            if (not sign and terms or
+                    num is None and unum is None and not x or
+                    mul and (not x or num is None and unum is None) or
+                    (exp or uexp) and not x or
+                    den is not None and int(den) == 0 or
+                    uden is not None and
+                    int(uden.translate(_from_subscript)) == 0):
+                raise ValueError(f"Invalid polynomial: error at position "
+                                 f"{pos}: {s[pos:pos + 20]!r}")
+            if num is not None:
+                if den is not None:
+                    c = Fraction(int(num), int(den))
+                elif "." in num:
+                    c = Fraction(num)
+                else:
+                    c = int(num)
+            elif unum is not None:
+                c = Fraction(int(unum.translate(_from_superscript)),
+                             int(uden.translate(_from_subscript)))
+            else:
+                c = 1
+            if sign == "-":
+                c = -c
+            if exp is not None:
+                e = int(exp)
+            elif uexp is not None:
+                e = int(uexp.translate(_from_superscript))
+            else:
+                e = 1 if x else 0
+            terms[e] = terms.get(e, 0) + c
+            pos = m.end()
+            if pos >= end:
+                break
+        n = max(terms) + 1
+        coeffs = [0] * n
+        for e, c in terms.items():
+            if type(c) is Fraction and c.denominator == 1:
+                c = c.numerator
+            coeffs[n - 1 - e] = c
+        res = cls()
+        res._coeffs = tuple(dropwhile(lambda c: c == 0, coeffs))
+        return res
 
     def __neg__(self) -> Self:
         """-self"""
@@ -195,7 +342,7 @@ class Polynomial:
             if len(self._coeffs) == 0:
                 return Polynomial(other)
             return Polynomial(*self._coeffs[:-1], self._coeffs[-1] + other)
-        raise TypeError(f"Can't add {type(other)}")
+        return NotImplemented
 
     __radd__ = __add__
 
@@ -207,7 +354,7 @@ class Polynomial:
             if len(self._coeffs) == 0:
                 return Polynomial(-other)
             return Polynomial(*self._coeffs[:-1], self._coeffs[-1] - other)
-        raise TypeError(f"Can't sub {type(other)}")
+        return NotImplemented
 
     def __rsub__(self, other: Union[Self, Rational]) -> Self:
         """other - self"""
@@ -226,6 +373,7 @@ class Polynomial:
             if other == 0:
                 return Polynomial()
             return Polynomial(*((c * other) for c in self._coeffs))
+        return NotImplemented
 
     __rmul__ = __mul__
 
@@ -252,6 +400,7 @@ class Polynomial:
             if other == 0:
                 raise ZeroDivisionError("Cannot divide by zero.")
             return divmod(self, Polynomial(other))
+        return NotImplemented
 
     def __rdivmod__(self, other: Rational) -> (Self, Self):
         """divmod(other, self)"""
@@ -273,13 +422,564 @@ class Polynomial:
         """other % self"""
         return divmod(other, self)[1]
 
+    def reducer(self) -> 'ModularReducer':
+        """
+        Returns:
+            A `ModularReducer` for reducing polynomials modulo `self`.
+
+        Raises:
+            ZeroDivisionError: If `self` is the zero polynomial.
+        """
+        return ModularReducer(self)
+
+    def factor(self) -> Tuple[Rational, Tuple[Tuple[Self, int], ...]]:
+        """
+        Factors the polynomial into irreducible factors over the rationals.
+
+        The polynomial is first split into square-free parts. Each part is
+        then factored modulo a small prime, the modular factors are lifted
+        by Hensel lifting and recombined into the true factors. Linear
+        factors with small numerators and denominators as well as parts of
+        degree up to 3 are handled without the modular machinery.
+
+        The result is cached on the instance.
+
+        Returns:
+            (c, ((f₁, e₁), …, (fₖ, eₖ))): A rational constant `c` and the
+            irreducible factors fᵢ together with their multiplicities eᵢ,
+            so that `self` == c⋅f₁^e₁⋅…⋅fₖ^eₖ. The factors are primitive
+            polynomials with integer coefficients and positive leading
+            coefficient, ordered by degree.
+
+        Examples
+        ========
+        >>> Polynomial(2, -2, -4).factor()
+        (2, ((Polynomial(1, -2), 1), (Polynomial(1, 1), 1)))
+        >>> Polynomial(Fraction(1, 2), 0, -1, 0).factor()
+        (Fraction(1, 2), ((Polynomial(1, 0), 1), (Polynomial(1, 0, -2), 1)))
+        """
+        try:
+            return self._factors
+        except AttributeError:
+            pass
+        if not self._coeffs:
+            res = (0, ())
+        else:
+            c, f = _zx_primitive(self._coeffs)
+            factors = [(g, e)
+                       for sqf, e in _zx_sqf_list(f)
+                       for g in _zx_factor_sqf(sqf)]
+            factors.sort(key=lambda item: (len(item[0]), item[0]))
+            res = (c, tuple((Polynomial(*g), e) for g, e in factors))
+        self._factors = res
+        return res
+
 
 Polynomial.ZERO = Polynomial()
 
+
+class ModularReducer:
+    """
+    Reduces polynomials modulo a fixed polynomial.
+
+    The reciprocal of the reversed modulus is computed once as a truncated
+    power series (Barrett reduction). Reducing a polynomial of degree less
+    than 2⋅d, where d is the degree of the modulus, then costs two truncated
+    multiplications instead of a full long division. Larger degrees are
+    supported as well; the reciprocal is extended as needed.
+
+    Instances are normally created by calling `Polynomial.reducer`.
+
+    Examples
+    ========
+    >>> m = Polynomial(1, 0, 0, -1)
+    >>> r = m.reducer()
+    >>> r.reduce(Polynomial(1, 0, 0, 0, 0))
+    Polynomial(1, 0)
+    >>> r.mulmod(Polynomial(1, 1), Polynomial(1, 0, 0))
+    Polynomial(1, 0, 1)
+    >>> r.powmod(Polynomial(1, 0), 2 ** 64)
+    Polynomial(1, 0)
+    """
+    __slots__ = ('_modulus', '_m_low', '_inv')
+
+    def __init__(self, modulus: Polynomial) -> None:
+        """
+        Initialize new `ModularReducer` instance.
+
+        Args:
+            modulus: The polynomial to reduce by
+
+        Raises:
+            ZeroDivisionError: If `modulus` is the zero polynomial.
+        """
+        if not modulus._coeffs:
+            raise ZeroDivisionError("Cannot divide by zero.")
+        self._modulus = modulus
+        d = modulus.degree()
+        # Only the d lowest coefficients of the modulus are needed to
+        # compute the remainder.
+        self._m_low = list(reversed(modulus._coeffs[1:]))
+        self._inv = _inv_series(modulus._coeffs, max(d - 1, 1))
+
+    @property
+    def modulus(self) -> Polynomial:
+        """The polynomial to reduce by."""
+        return self._modulus
+
+    def _reduce(self, f: List[Rational]) -> List[Rational]:
+        d = len(self._m_low)
+        k = len(f) - d
+        if k <= 0:
+            return f
+        if d == 0:
+            return []
+        if k > len(self._inv):
+            self._inv = _inv_series(self._modulus._coeffs, k, self._inv)
+        # The coefficients of f in descending order are those of its
+        # reversal in ascending order, so this gives the quotient in
+        # descending order.
+        q = _mullow(f[:k], self._inv, k)
+        q.reverse()
+        qm = _mullow(q, self._m_low, d)
+        return _strip([a - b for a, b in zip(f[-1:-d - 1:-1], qm)][::-1])
+
+    def reduce(self, f: Polynomial) -> Polynomial:
+        """
+        Args:
+            f: The polynomial to reduce
+
+        Returns:
+            `f` % `modulus`
+        """
+        res = Polynomial()
+        res._coeffs = tuple(self._reduce(list(f._coeffs)))
+        return res
+
+    def mulmod(self, f: Polynomial, g: Polynomial) -> Polynomial:
+        """
+        Args:
+            f: First factor
+            g: Second factor
+
+        Returns:
+            (`f` * `g`) % `modulus`
+        """
+        res = Polynomial()
+        res._coeffs = tuple(self._reduce(_mul(list(f._coeffs),
+                                              list(g._coeffs))))
+        return res
+
+    def powmod(self, f: Polynomial, n: int) -> Polynomial:
+        """
+        Computes `f` to the power of `n` modulo `modulus` by repeated
+        squaring, reducing each intermediate product.
+
+        Args:
+            f: The base
+            n: The exponent, a non-negative integer
+
+        Returns:
+            (`f` ** `n`) % `modulus`
+
+        Raises:
+            ValueError: If `n` is negative.
+        """
+        if n < 0:
+            raise ValueError("Exponent must not be negative.")
+        base = self._reduce(list(f._coeffs))
+        acc = self._reduce([1])
+        while n:
+            if n & 1:
+                acc = self._reduce(_mul(acc, base))
+            n >>= 1
+            if n:
+                base = self._reduce(_mul(base, base))
+        res = Polynomial()
+        res._coeffs = tuple(acc)
+        return res
+
+
+class PowerSeries:
+    """
+    Represents truncated power series with rational coefficients.
+
+    A power series is given by a `Polynomial` and a precision n; it stands
+    for that polynomial plus some unknown terms of degree n or higher, i.e.
+    the polynomial modulo xⁿ. Terms of degree n or higher are dropped from
+    the polynomial.
+
+    All operations only compute the coefficients below the precision of the
+    result: products are truncated and the inverse, logarithm, exponential
+    and square root are computed by Newton iteration, doubling the number of
+    correct coefficients in each step, so that each of them costs a small
+    constant number of multiplications.
+
+    Examples
+    ========
+    >>> from polynomial import Polynomial, PowerSeries
+    >>> s = PowerSeries(Polynomial(-1, 1), 5)
+    >>> s
+    PowerSeries(Polynomial(-1, 1), 5)
+    >>> print(s)
+    f(x) = 1 - x + O(x⁵)
+    >>> print(s.inverse())
+    f(x) = 1 + x + x² + x³ + x⁴ + O(x⁵)
+    >>> print(PowerSeries(Polynomial(1, 0), 5).exp())
+    f(x) = 1 + x + ¹/₂⋅x² + ¹/₆⋅x³ + ¹/₂₄⋅x⁴ + O(x⁵)
+    """
+    __slots__ = ('_coeffs', '_prec')
+
+    def __init__(self, f: Union[Polynomial, Rational], prec: int) -> None:
+        """
+        Initialize new `PowerSeries` instance.
+
+        Args:
+            f: Polynomial (or rational constant) giving the coefficients
+            prec: The precision n, i.e. the series is known modulo xⁿ
+
+        Raises:
+            TypeError: If `f` is neither a Polynomial nor a Rational or if
+                `prec` is not an int.
+            ValueError: If `prec` is negative.
+        """
+        if isinstance(f, Rational):
+            f = Polynomial(f) if f != 0 else Polynomial.ZERO
+        elif not isinstance(f, Polynomial):
+            raise TypeError("Coefficients must be given as polynomial.")
+        if not isinstance(prec, int):
+            raise TypeError("Precision must be an int.")
+        if prec < 0:
+            raise ValueError("Precision must not be negative.")
+        self._coeffs = tuple(dropwhile(lambda c: c == 0,
+                                       f._coeffs[-prec:] if prec else ()))
+        self._prec = prec
+
+    @property
+    def precision(self) -> int:
+        """The precision n, i.e. the series is known modulo xⁿ."""
+        return self._prec
+
+    @property
+    def polynomial(self) -> Polynomial:
+        """The polynomial formed by the known terms."""
+        res = Polynomial()
+        res._coeffs = self._coeffs
+        return res
+
+    def _low(self, n: int) -> List[Rational]:
+        """Coefficients modulo xⁿ in ascending order."""
+        res = list(reversed(self._coeffs[-n:])) if n else []
+        return res + [0] * (n - len(res))
+
+    def __eq__(self, other: Self) -> bool:
+        """
+        `self` == `other`
+
+        Two power series are considered equal if their precisions and their
+        coefficients are equal.
+        """
+        if not isinstance(other, PowerSeries):
+            return NotImplemented
+        return self._prec == other._prec and self._coeffs == other._coeffs
+
+    def __hash__(self) -> int:
+        """hash(self)"""
+        return hash((self._coeffs, self._prec))
+
+    def __copy__(self) -> Self:
+        """copy(self)"""
+        return self
+
+    def __deepcopy__(self) -> Self:
+        """deepcopy(self)"""
+        return self.__copy__()
+
+    def __repr__(self) -> str:
+        """repr(self)"""
+        return "%s(%r, %d)" % (self.__class__.__name__, self.polynomial,
+                               self._prec)
+
+    def __str__(self) -> str:
+        """str(self)"""
+        terms = "".join(_iter_terms(enumerate(reversed(self._coeffs))))
+        prec = self._prec
+        o = ("O(1)" if prec == 0 else "O(x)" if prec == 1 else
+             f"O(x{str(prec).translate(_to_superscript)})")
+        return f"f(x) = {terms} + {o}" if terms else f"f(x) = {o}"
+
+    def __neg__(self) -> Self:
+        """-self"""
+        return _series([-c for c in self._low(self._prec)], self._prec)
+
+    def _operand(self, other: Union[Self, Polynomial, Rational]) -> Self:
+        if isinstance(other, PowerSeries):
+            return other
+        if isinstance(other, (Polynomial, Rational)):
+            return PowerSeries(other, self._prec)
+        return NotImplemented
+
+    def __add__(self, other: Union[Self, Polynomial, Rational]) -> Self:
+        """self + other"""
+        other = self._operand(other)
+        if other is NotImplemented:
+            return other
+        n = min(self._prec, other._prec)
+        return _series(list(map(add, self._low(n), other._low(n))), n)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Union[Self, Polynomial, Rational]) -> Self:
+        """self - other"""
+        other = self._operand(other)
+        if other is NotImplemented:
+            return other
+        n = min(self._prec, other._prec)
+        return _series(list(map(sub, self._low(n), other._low(n))), n)
+
+    def __rsub__(self, other: Union[Polynomial, Rational]) -> Self:
+        """other - self"""
+        return -self + other
+
+    def __mul__(self, other: Union[Self, Polynomial, Rational]) -> Self:
+        """self * other"""
+        if isinstance(other, Rational):
+            return _series([c * other for c in self._low(self._prec)],
+                           self._prec)
+        other = self._operand(other)
+        if other is NotImplemented:
+            return other
+        n = min(self._prec, other._prec)
+        return _series(_mullow(self._low(n), other._low(n), n), n)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Union[Self, Polynomial, Rational]) -> Self:
+        """self / other"""
+        if isinstance(other, Rational):
+            if other == 0:
+                raise ZeroDivisionError("Cannot divide by zero.")
+            return self * _recip(other)
+        other = self._operand(other)
+        if other is NotImplemented:
+            return other
+        return self * other.inverse()
+
+    def __rtruediv__(self, other: Union[Polynomial, Rational]) -> Self:
+        """other / self"""
+        return self.inverse() * other
+
+    def inverse(self) -> Self:
+        """
+        Returns:
+            1 / `self`
+
+        Raises:
+            ZeroDivisionError: If the constant term of `self` is zero.
+        """
+        n = self._prec
+        if n == 0:
+            return self
+        a = self._low(n)
+        if a[0] == 0:
+            raise ZeroDivisionError("Constant term must not be zero.")
+        return _series(_inv_series(a, n), n)
+
+    def derivative(self) -> Self:
+        """
+        Returns:
+            The derivative of `self`; its precision is one less.
+        """
+        n = max(self._prec - 1, 0)
+        return _series(_series_deriv(self._low(self._prec)), n)
+
+    def integral(self) -> Self:
+        """
+        Returns:
+            The integral of `self` with constant term 0; its precision is
+            one more.
+        """
+        n = self._prec + 1
+        return _series(_series_integral(self._low(self._prec)), n)
+
+    def log(self) -> Self:
+        """
+        Returns:
+            The natural logarithm of `self`.
+
+        Raises:
+            ValueError: If the constant term of `self` is not 1.
+        """
+        n = self._prec
+        a = self._low(n)
+        if n and a[0] != 1:
+            raise ValueError("Constant term must be 1.")
+        return _series(_log_series(a, n), n)
+
+    def exp(self) -> Self:
+        """
+        Returns:
+            The exponential of `self`.
+
+        Raises:
+            ValueError: If the constant term of `self` is not 0.
+        """
+        n = self._prec
+        a = self._low(n)
+        if n and a[0] != 0:
+            raise ValueError("Constant term must be 0.")
+        return _series(_exp_series(a, n), n)
+
+    def sqrt(self) -> Self:
+        """
+        Returns:
+            The square root of `self` with positive constant term.
+
+        Raises:
+            ValueError: If the constant term of `self` is not the square of a
+                non-zero rational number.
+        """
+        n = self._prec
+        a = self._low(n)
+        if n == 0:
+            return self
+        c = Fraction(a[0])
+        if c > 0:
+            num, den = isqrt(c.numerator), isqrt(c.denominator)
+            if num * num == c.numerator and den * den == c.denominator:
+                return _series(_inv_sqrt_series(a, n, Fraction(den, num)),
+                               n) * self
+        raise ValueError("Constant term must be the square of a non-zero "
+                         "rational number.")
+
+
+def _series(a: List[Rational], prec: int) -> PowerSeries:
+    """Create `PowerSeries` from ascending coefficients."""
+    res = PowerSeries(Polynomial.ZERO, prec)
+    res._coeffs = tuple(dropwhile(lambda c: c == 0,
+                                  (c.numerator if type(c) is Fraction and
+                                   c.denominator == 1 else c
+                                   for c in reversed(a[:prec]))))
+    return res
+
+
+_CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class EvalCache:
+    """
+    Bounded cache for the values of polynomials at given points.
+
+    The cache is a side table keyed by (polynomial, x); polynomials are not
+    changed in any way, so there is no cost for evaluations not going
+    through a cache. If the cache is full, the least recently used entry is
+    evicted. An instance can safely be shared between threads.
+
+    Examples
+    ========
+    >>> cache = EvalCache(maxsize=2)
+    >>> f = Polynomial(1, 0, -1)
+    >>> cache.eval(f, 3)
+    8
+    >>> cache.eval(f, 3)
+    8
+    >>> cache.cache_info()
+    CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+    """
+    __slots__ = ('_maxsize', '_cache', '_lock', '_hits', '_misses')
+
+    def __init__(self, maxsize: Optional[int] = 1024) -> None:
+        """
+        Initialize new `EvalCache` instance.
+
+        Args:
+            maxsize: The maximum number of cached values or None for an
+                unbounded cache
+
+        Raises:
+            TypeError: If `maxsize` is neither an int nor None.
+            ValueError: If `maxsize` is negative.
+        """
+        if maxsize is not None:
+            if not isinstance(maxsize, int):
+                raise TypeError("Maxsize must be an int or None.")
+            if maxsize < 0:
+                raise ValueError("Maxsize must not be negative.")
+        self._maxsize = maxsize
+        self._cache = OrderedDict()
+        self._lock = Lock()
+        self._hits = self._misses = 0
+
+    @property
+    def maxsize(self) -> Optional[int]:
+        """The maximum number of cached values (None = unbounded)."""
+        return self._maxsize
+
+    def __len__(self) -> int:
+        """len(self)"""
+        return len(self._cache)
+
+    def eval(self, f: Polynomial, x: Rational) -> Rational:
+        """
+        Evaluates the polynomial `f` at value `x`, using the cached value,
+        if available.
+
+        Args:
+            f: The polynomial to evaluate
+            x: The value to evaluate the polynomial at
+
+        Returns:
+            f(x): The value of the polynomial at `x`
+        """
+        # The type of x is part of the key, because equal values of
+        # different types may give results of different types.
+        key = (f, x, type(x))
+        cache = self._cache
+        with self._lock:
+            try:
+                fx = cache[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                cache.move_to_end(key)
+                self._hits += 1
+                return fx
+        # Evaluate without holding the lock, so that other threads are not
+        # blocked.
+        fx = f.eval(x)
+        maxsize = self._maxsize
+        if maxsize != 0:
+            with self._lock:
+                cache[key] = fx
+                cache.move_to_end(key)
+                if maxsize is not None and len(cache) > maxsize:
+                    cache.popitem(last=False)
+        return fx
+
+    __call__ = eval
+
+    def cache_info(self) -> _CacheInfo:
+        """
+        Returns:
+            (hits, misses, maxsize, currsize): Statistics of the cache
+        """
+        with self._lock:
+            return _CacheInfo(self._hits, self._misses, self._maxsize,
+                              len(self._cache))
+
+    def cache_clear(self) -> None:
+        """Removes all entries from the cache and resets the statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = 0
+
+
 # helper for conversion to str
 
 _to_superscript = str.maketrans("-0123456789", "⁻⁰¹²³⁴⁵⁶⁷⁸⁹")
 _to_subscript = str.maketrans("-0123456789", "₋₀₁₂₃₄₅₆₇₈₉")
+# Number of terms joined into a single call of `write`
+_WRITE_CHUNK_SIZE = 1024
 
 
 def _to_str(num: Rational) -> str:
@@ -290,3 +990,600 @@ def _to_str(num: Rational) -> str:
     else:
         return f"{str(num.numerator).translate(_to_superscript)}/" \
                f"{str(num.denominator).translate(_to_subscript)}"
+
+
+def _iter_terms(terms: Iterable[Tuple[int, Rational]],
+                ascii: bool = False) -> Iterator[str]:
+    """Iterate over the string representations of the given (exponent,
+    coefficient) pairs, joined by their signs; zero terms are skipped."""
+    if ascii:
+        to_str, mul = _to_ascii_str, "*x"
+    else:
+        to_str, mul = _to_str, "⋅x"
+    first = True
+    for e, c in terms:
+        if c == 0:
+            continue
+        if first:
+            s = "" if c > 0 else "-"
+            first = False
+        else:
+            s = " + " if c > 0 else " - "
+        c = abs(c)
+        if e == 0:
+            yield f"{s}{to_str(c)}"
+            continue
+        x = "x" if c == 1 else f"{to_str(c)}{mul}"
+        if e == 1:
+            yield f"{s}{x}"
+        elif ascii:
+            yield f"{s}{x}^{e}"
+        else:
+            yield f"{s}{x}{str(e).translate(_to_superscript)}"
+
+
+def _to_ascii_str(num: Rational) -> str:
+    if type(num) == int or num.denominator == 1:
+        return str(num.numerator)
+    else:
+        return f"{num.numerator}/{num.denominator}"
+
+
+# helper for conversion from str
+
+_from_superscript = str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹", "0123456789")
+_from_subscript = str.maketrans("₀₁₂₃₄₅₆₇₈₉", "0123456789")
+
+_PREFIX_RE = re.compile(r"\s*(?:[A-Za-z]\w*\s*\(\s*x\s*\)\s*=)?")
+_TERM_RE = re.compile(r"""
+    \s*(?P<sign>[-+])?\s*
+    (?:
+        (?P<num>\d+(?:\.\d*)?)(?:\s*/\s*(?P<den>\d+))?
+        |
+        (?P<unum>[⁰¹²³⁴⁵⁶⁷⁸⁹]+)/(?P<uden>[₀₁₂₃₄₅₆₇₈₉]+)
+    )?
+    \s*(?P<mul>[*⋅](?!\*))?\s*
+    (?P<x>x)?
+    (?:
+        \s*(?:\^|\*\*)\s*(?P<exp>\d+)
+        |
+        (?P<uexp>[⁰¹²³⁴⁵⁶⁷⁸⁹]+)
+    )?
+    \s*
+""", re.VERBOSE)
+
+
+# helpers for arithmetic on coefficient lists
+#
+# Unless noted otherwise, polynomials are handled as lists of coefficients in
+# descending order, like in `Polynomial._coeffs`; the zero polynomial is the
+# empty list. Truncated power series (i.e. polynomials modulo xᵏ) are handled
+# as lists of coefficients in ascending order. Note that the coefficients of
+# a polynomial in descending order are the coefficients of its reversal in
+# ascending order.
+
+# Minimum length of both operands for multiplying by Kronecker substitution
+_KRONECKER_THRESHOLD = 16
+
+
+def _strip(a: List[Rational]) -> List[Rational]:
+    i = 0
+    while i < len(a) and a[i] == 0:
+        i += 1
+    return a[i:]
+
+
+def _add(a: List[Rational], b: List[Rational]) -> List[Rational]:
+    if len(a) < len(b):
+        a, b = b, a
+    d = len(a) - len(b)
+    return _strip(a[:d] + [x + y for x, y in zip(a[d:], b)])
+
+
+def _sub(a: List[Rational], b: List[Rational]) -> List[Rational]:
+    d = len(a) - len(b)
+    if d >= 0:
+        return _strip(a[:d] + [x - y for x, y in zip(a[d:], b)])
+    return _strip([-y for y in b[:-d]] + [x - y for x, y in zip(a, b[-d:])])
+
+
+def _mul(a: List[Rational], b: List[Rational]) -> List[Rational]:
+    """Product of `a` and `b`. As the product is the convolution of the
+    coefficient lists, this works on lists in either order."""
+    if not a or not b:
+        return []
+    if min(len(a), len(b)) >= _KRONECKER_THRESHOLD:
+        if all(type(c) is int for c in chain(a, b)):
+            return _kronecker_mul(a, b)
+        if all(type(c) in (int, Fraction) for c in chain(a, b)):
+            da = lcm(*(c.denominator for c in a))
+            db = lcm(*(c.denominator for c in b))
+            d = da * db
+            return [Fraction(c, d) for c in _kronecker_mul(
+                [c.numerator * (da // c.denominator) for c in a],
+                [c.numerator * (db // c.denominator) for c in b])]
+    res = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b, i):
+                res[j] += x * y
+    return res
+
+
+def _kronecker_mul(a: List[int], b: List[int]) -> List[int]:
+    """Product of the integer lists `a` and `b` by Kronecker substitution:
+    both lists are packed into a single integer, with slots wide enough to
+    hold any coefficient of the product, so that the product is computed by
+    one multiplication of (big) integers."""
+    bound = max(map(abs, a)) * max(map(abs, b)) * min(len(a), len(b))
+    size = (bound.bit_length() + 1) // 8 + 1
+    n = len(a) + len(b) - 1
+    # Adding half the slot range to each slot makes all slots non-negative,
+    # so that the coefficients can be read from the bytes of the result.
+    half = 1 << (8 * size - 1)
+    offset = int.from_bytes(half.to_bytes(size, 'little') * n, 'little')
+    data = (_pack(a, size) * _pack(b, size) + offset).to_bytes(size * n,
+                                                               'little')
+    return [int.from_bytes(data[i:i + size], 'little') - half
+            for i in range(0, size * n, size)]
+
+
+def _pack(a: List[int], size: int) -> int:
+    """Σ a[i]⋅256^(size⋅i)"""
+    pos = b''.join((c if c > 0 else 0).to_bytes(size, 'little') for c in a)
+    neg = b''.join((-c if c < 0 else 0).to_bytes(size, 'little') for c in a)
+    return int.from_bytes(pos, 'little') - int.from_bytes(neg, 'little')
+
+
+def _deriv(a: List[Rational]) -> List[Rational]:
+    n = len(a) - 1
+    return [c * (n - i) for i, c in enumerate(a[:-1])]
+
+
+def _mullow(a: List[Rational], b: List[Rational], k: int) \
+        -> List[Rational]:
+    """Product of the ascending lists `a` and `b` modulo xᵏ."""
+    a = a[:k]
+    b = b[:k]
+    if min(len(a), len(b)) >= _KRONECKER_THRESHOLD:
+        res = _mul(a, b)[:k]
+        return res + [0] * (k - len(res))
+    res = [0] * k
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b[:k - i], i):
+                res[j] += x * y
+    return res
+
+
+def _recip(c: Rational) -> Rational:
+    r = 1 / Fraction(c)
+    return r.numerator if r.denominator == 1 else r
+
+
+def _inv_series(a: List[Rational], k: int,
+                g: List[Rational] = None) -> List[Rational]:
+    """Reciprocal of the ascending list `a` modulo xᵏ by Newton iteration;
+    `g` may give the reciprocal to a lower precision as starting point."""
+    if not g:
+        g = [_recip(a[0])]
+    n = len(g)
+    while n < k:
+        n = min(2 * n, k)
+        e = [-c for c in _mullow(a, g, n)]
+        e[0] += 2
+        g = _mullow(g, e, n)
+    return g[:k]
+
+
+def _series_deriv(a: List[Rational]) -> List[Rational]:
+    return [i * c for i, c in enumerate(a[1:], 1)]
+
+
+def _series_integral(a: List[Rational]) -> List[Rational]:
+    return [0] + [Fraction(c) / i for i, c in enumerate(a, 1)]
+
+
+def _log_series(a: List[Rational], k: int) -> List[Rational]:
+    """Logarithm of the ascending list `a` with a[0] == 1 modulo xᵏ."""
+    if k <= 1:
+        return [0] * k
+    return _series_integral(_mullow(_series_deriv(a[:k]),
+                                    _inv_series(a, k - 1), k - 1))
+
+
+def _exp_series(a: List[Rational], k: int) -> List[Rational]:
+    """Exponential of the ascending list `a` with a[0] == 0 modulo xᵏ by
+    Newton iteration."""
+    g = [1]
+    n = 1
+    while n < k:
+        n = min(2 * n, k)
+        # g ← g⋅(1 + a - log(g))
+        e = [c - d for c, d in zip(a[:n] + [0] * (n - len(a)),
+                                   _log_series(g + [0] * (n - len(g)), n))]
+        e[0] += 1
+        g = _mullow(g, e, n)
+    return g[:k]
+
+
+def _inv_sqrt_series(a: List[Rational], k: int,
+                     c: Rational) -> List[Rational]:
+    """Reciprocal of the square root of the ascending list `a` modulo xᵏ by
+    Newton iteration; `c` must be the reciprocal of the square root of
+    a[0]."""
+    g = [c]
+    n = 1
+    while n < k:
+        n = min(2 * n, k)
+        # g ← g⋅(3 - a⋅g²) / 2
+        e = [-d for d in _mullow(a, _mullow(g, g, n), n)]
+        e[0] += 3
+        g = [Fraction(d) / 2 for d in _mullow(g, e, n)]
+    return g[:k]
+
+
+# helpers for factorization
+#
+# Functions prefixed with `_zx_` operate on polynomials with integer
+# coefficients, those prefixed with `_gf_` on polynomials with coefficients
+# reduced modulo `p`, where `p` is a prime or - for Hensel lifting - a prime
+# power; divisors must then have a leading coefficient invertible mod `p`.
+
+# Linear factors are searched directly, if the leading and the trailing
+# coefficient do not exceed this bound.
+_RATIONAL_ROOT_BOUND = 10 ** 4
+# Number of suitable primes to try before choosing the one giving the
+# smallest number of modular factors.
+_N_PRIMES_TO_TRY = 3
+
+
+def _sym(a: List[int], m: int) -> List[int]:
+    """Symmetric representation of `a` modulo `m`."""
+    h = m // 2
+    return [c - m if c > h else c for c in a]
+
+
+def _zx_primitive(coeffs: Tuple[Rational, ...]) -> (Rational, List[int]):
+    """Split rational coefficients into content and primitive part."""
+    den = lcm(*(c.denominator for c in coeffs))
+    f = [c.numerator * (den // c.denominator) for c in coeffs]
+    g = gcd(*f)
+    if f[0] < 0:
+        g = -g
+    c = Fraction(g, den)
+    return (c.numerator if c.denominator == 1 else c), [a // g for a in f]
+
+
+def _zx_pp(a: List[int]) -> List[int]:
+    g = gcd(*a)
+    if a[0] < 0:
+        g = -g
+    return [c // g for c in a]
+
+
+def _zx_prem(a: List[int], b: List[int]) -> List[int]:
+    """Pseudo-remainder of `a` divided by `b`, up to a constant factor."""
+    lb = b[0]
+    r = a
+    while len(r) >= len(b):
+        lr = r[0]
+        r = [lb * c for c in r]
+        for j, c in enumerate(b):
+            r[j] -= lr * c
+        r = _strip(r)
+    return r
+
+
+def _zx_gcd(a: List[int], b: List[int]) -> List[int]:
+    """Primitive gcd of the primitive polynomials `a` and `b`."""
+    if len(a) < len(b):
+        a, b = b, a
+    while b:
+        r = _zx_prem(a, b)
+        a, b = b, (_zx_pp(r) if r else r)
+    return _zx_pp(a)
+
+
+def _zx_divexact(a: List[int], b: List[int]) -> List[int]:
+    """Quotient of `a` divided by `b`, which must divide `a` over Z."""
+    r = list(a)
+    lb = b[0]
+    q = []
+    for i in range(len(a) - len(b) + 1):
+        c = r[i] // lb
+        q.append(c)
+        if c:
+            for j in range(1, len(b)):
+                r[i + j] -= c * b[j]
+    return q
+
+
+def _zx_sqf_list(f: List[int]) -> List[Tuple[List[int], int]]:
+    """Square-free decomposition of the primitive polynomial `f`."""
+    res = []
+    if len(f) < 2:
+        return res
+    c = _zx_gcd(f, _zx_pp(_deriv(f)))
+    w = _zx_divexact(f, c)
+    i = 1
+    while len(c) > 1:
+        y = _zx_gcd(w, c)
+        z = _zx_divexact(w, y)
+        if len(z) > 1:
+            res.append((z, i))
+        w = y
+        c = _zx_divexact(c, y)
+        i += 1
+    if len(w) > 1:
+        res.append((w, i))
+    return res
+
+
+def _divisors(n: int) -> List[int]:
+    n = abs(n)
+    small, large = [], []
+    for d in range(1, isqrt(n) + 1):
+        if n % d == 0:
+            small.append(d)
+            if d * d != n:
+                large.append(n // d)
+    return small + large[::-1]
+
+
+def _zx_linear_factors(f: List[int]) -> (List[List[int]], List[int]):
+    """Split off the linear factors of the square-free polynomial `f`."""
+    res = []
+    if f[-1] == 0:
+        res.append([1, 0])
+        f = f[:-1]
+    if len(f) < 3 or max(f[0], abs(f[-1])) > _RATIONAL_ROOT_BOUND:
+        return res, f
+    for q in _divisors(f[0]):
+        for p in _divisors(f[-1]):
+            if gcd(p, q) != 1:
+                continue
+            for p in (p, -p):
+                if len(f) < 2:
+                    return res, f
+                # qⁿ⋅f(p/q) == 0 ?
+                v = 0
+                qk = 1
+                for c in f:
+                    v = v * p + c * qk
+                    qk *= q
+                if v == 0:
+                    res.append([q, -p])
+                    f = _zx_divexact(f, [q, -p])
+    return res, f
+
+
+def _zx_factor_sqf(f: List[int]) -> List[List[int]]:
+    """Irreducible factors of the primitive square-free polynomial `f`."""
+    res, f = _zx_linear_factors(f)
+    n = len(f) - 1
+    if n < 1:
+        return res
+    if n == 1:
+        return res + [f]
+    if n == 2:
+        a, b, c = f
+        disc = b * b - 4 * a * c
+        if disc >= 0:
+            r = isqrt(disc)
+            if r * r == disc:
+                return res + [_zx_pp([2 * a, b - r]), _zx_pp([2 * a, b + r])]
+        return res + [f]
+    if n == 3 and max(f[0], abs(f[-1])) <= _RATIONAL_ROOT_BOUND:
+        # no rational root => irreducible
+        return res + [f]
+    return res + _zx_zassenhaus(f)
+
+
+def _zx_zassenhaus(f: List[int]) -> List[List[int]]:
+    """Factor the primitive square-free polynomial `f` using modular
+    factorization, Hensel lifting and recombination of the lifted factors
+    (Zassenhaus' algorithm)."""
+    rng = Random(len(f))
+    p, fs = _choose_prime(f, rng)
+    if len(fs) == 1:
+        return [f]
+    n = len(f) - 1
+    b = f[0]
+    # Bound for the coefficients of factors of f (Mignotte)
+    r = isqrt(n + 1)
+    if r * r < n + 1:
+        r += 1
+    bound = r * 2 ** n * max(abs(c) for c in f) * b
+    m = p
+    while m <= 2 * bound + 1:
+        m *= m
+    lifted = _hensel_lift(f, fs, p, m)
+    res = []
+    idxs = list(range(len(lifted)))
+    s = 1
+    while 2 * s <= len(idxs):
+        for subset in combinations(idxs, s):
+            g = [b]
+            h = [b]
+            for i in idxs:
+                if i in subset:
+                    g = [c % m for c in _mul(g, lifted[i])]
+                else:
+                    h = [c % m for c in _mul(h, lifted[i])]
+            g = _sym(g, m)
+            h = _sym(h, m)
+            if sum(map(abs, g)) * sum(map(abs, h)) <= bound:
+                idxs = [i for i in idxs if i not in subset]
+                res.append(_zx_pp(g))
+                f = _zx_pp(h)
+                b = f[0]
+                break
+        else:
+            s += 1
+    res.append(f)
+    return res
+
+
+def _primes():
+    yield 3
+    p = 5
+    while True:
+        if all(p % d for d in range(3, isqrt(p) + 1, 2)):
+            yield p
+        p += 2
+
+
+def _choose_prime(f: List[int], rng: Random) -> (int, List[List[int]]):
+    """Find a small prime modulo which `f` stays square-free and return it
+    together with the monic irreducible factors of `f` modulo that prime."""
+    best = None
+    n_tried = 0
+    for p in _primes():
+        if f[0] % p == 0:
+            continue
+        fp = _gf_monic([c % p for c in f], p)
+        if len(_gf_gcd(fp, _gf_reduce(_deriv(fp), p), p)) > 1:
+            continue
+        fs = _gf_factor_sqf(fp, p, rng)
+        if best is None or len(fs) < len(best[1]):
+            best = (p, fs)
+        n_tried += 1
+        if len(fs) == 1 or n_tried == _N_PRIMES_TO_TRY:
+            return best
+
+
+def _gf_reduce(a: List[int], p: int) -> List[int]:
+    return _strip([c % p for c in a])
+
+
+def _gf_monic(a: List[int], p: int) -> List[int]:
+    if not a or a[0] == 1:
+        return a
+    inv = pow(a[0], -1, p)
+    return [c * inv % p for c in a]
+
+
+def _gf_divmod(a: List[int], b: List[int], p: int) \
+        -> (List[int], List[int]):
+    nb = len(b)
+    if len(a) < nb:
+        return [], a
+    inv = pow(b[0], -1, p)
+    r = list(a)
+    q = []
+    for i in range(len(a) - nb + 1):
+        c = r[i] * inv % p
+        q.append(c)
+        if c:
+            for j in range(1, nb):
+                r[i + j] -= c * b[j]
+    return q, _gf_reduce(r[len(q):], p)
+
+
+def _gf_gcd(a: List[int], b: List[int], p: int) -> List[int]:
+    while b:
+        a, b = b, _gf_divmod(a, b, p)[1]
+    return _gf_monic(a, p)
+
+
+def _gf_gcdex(a: List[int], b: List[int], p: int) \
+        -> (List[int], List[int], List[int]):
+    """Monic g = gcd(a, b) and s, t with s⋅a + t⋅b == g (mod p)."""
+    r0, r1 = a, b
+    s0, s1 = [1], []
+    t0, t1 = [], [1]
+    while r1:
+        q, r = _gf_divmod(r0, r1, p)
+        r0, r1 = r1, r
+        s0, s1 = s1, _gf_reduce(_sub(s0, _mul(q, s1)), p)
+        t0, t1 = t1, _gf_reduce(_sub(t0, _mul(q, t1)), p)
+    inv = pow(r0[0], -1, p)
+    return ([c * inv % p for c in r0], [c * inv % p for c in s0],
+            [c * inv % p for c in t0])
+
+
+def _gf_powmod(a: List[int], e: int, f: List[int], p: int) -> List[int]:
+    res = [1]
+    a = _gf_divmod(a, f, p)[1]
+    while e:
+        if e & 1:
+            res = _gf_divmod(_mul(res, a), f, p)[1]
+        e >>= 1
+        if e:
+            a = _gf_divmod(_mul(a, a), f, p)[1]
+    return res
+
+
+def _gf_factor_sqf(f: List[int], p: int, rng: Random) -> List[List[int]]:
+    """Monic irreducible factors of the monic square-free polynomial `f`
+    over GF(p) (distinct-degree and equal-degree factorization)."""
+    res = []
+    h = [1, 0]
+    i = 1
+    while len(f) - 1 >= 2 * i:
+        h = _gf_powmod(h, p, f, p)
+        g = _gf_gcd(f, _gf_reduce(_sub(h, [1, 0]), p), p)
+        if len(g) > 1:
+            res.extend(_gf_edf(g, i, p, rng))
+            f = _gf_divmod(f, g, p)[0]
+            h = _gf_divmod(h, f, p)[1]
+        i += 1
+    if len(f) > 1:
+        res.append(f)
+    return res
+
+
+def _gf_edf(f: List[int], d: int, p: int, rng: Random) -> List[List[int]]:
+    """Split `f`, a product of irreducible factors of degree `d` over GF(p),
+    into its factors (Cantor-Zassenhaus)."""
+    n = len(f) - 1
+    if n == d:
+        return [f]
+    e = (p ** d - 1) // 2
+    while True:
+        a = _strip([rng.randrange(p) for _ in range(n)])
+        if len(a) < 2:
+            continue
+        g = _gf_gcd(f, _gf_reduce(_sub(_gf_powmod(a, e, f, p), [1]), p), p)
+        if 1 < len(g) < len(f):
+            return (_gf_edf(g, d, p, rng) +
+                    _gf_edf(_gf_divmod(f, g, p)[0], d, p, rng))
+
+
+def _hensel_step(f: List[int], g: List[int], h: List[int], s: List[int],
+                 t: List[int], m: int) \
+        -> (List[int], List[int], List[int], List[int]):
+    """Lift f ≡ g⋅h and s⋅g + t⋅h ≡ 1 from modulus m to modulus m²;
+    `h` must be monic."""
+    m2 = m * m
+    e = _gf_reduce(_sub(f, _mul(g, h)), m2)
+    q, r = _gf_divmod(_mul(s, e), h, m2)
+    g = _gf_reduce(_add(g, _add(_mul(t, e), _mul(q, g))), m2)
+    h = _gf_reduce(_add(h, r), m2)
+    b = _gf_reduce(_sub(_add(_mul(s, g), _mul(t, h)), [1]), m2)
+    c, d = _gf_divmod(_mul(s, b), h, m2)
+    s = _gf_reduce(_sub(s, d), m2)
+    t = _gf_reduce(_sub(t, _add(_mul(t, b), _mul(c, g))), m2)
+    return g, h, s, t
+
+
+def _hensel_lift(f: List[int], fs: List[List[int]], p: int, m: int) \
+        -> List[List[int]]:
+    """Lift the monic factors `fs` of `f` modulo `p` to monic factors
+    modulo `m`, which must be a power p^(2^k)."""
+    res = []
+    lc = f[0]
+    for i, h in enumerate(fs[:-1]):
+        g = [lc % p]
+        for u in fs[i + 1:]:
+            g = _gf_reduce(_mul(g, u), p)
+        _, s, t = _gf_gcdex(g, h, p)
+        k = p
+        while k < m:
+            g, h, s, t = _hensel_step(f, g, h, s, t, k)
+            k *= k
+        res.append(h)
+        f = g
+    res.append(_gf_monic(_gf_reduce(f, m), m))
+    return res
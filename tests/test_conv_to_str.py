@@ -10,6 +10,7 @@
 
 
 """Test conversions to strings."""
+import io
 from fractions import Fraction
 
 import pytest
@@ -57,3 +58,37 @@ def test_str_int_coeffs(p: Polynomial, s: str) -> None:
                            "f(x) = ⁵/₇⋅x⁵ - x² - ¹/₃⋅x + 19")])
 def test_str_rational_coeffs(p: Polynomial, s: str) -> None:
     assert str(p) == s
+
+
+@pytest.mark.parametrize("p", [Polynomial(),
+                               Polynomial(-238),
+                               Polynomial(5, 0, 0, -1, -1, 19),
+                               Polynomial(Fraction(1, 10), Fraction(7, 4),
+                                          Fraction(0, 2), Fraction(-1, 4))])
+def test_write(p: Polynomial) -> None:
+    file = io.StringIO()
+    p.write(file)
+    assert file.getvalue() == str(p)
+
+
+@pytest.mark.parametrize(("p", "s"),
+                         [(Polynomial(), "f(x) = 0"),
+                          (Polynomial(Fraction(-23, 8)), "f(x) = -23/8"),
+                          (Polynomial(7, -3), "f(x) = 7*x - 3"),
+                          (Polynomial(Fraction(1, 10), Fraction(7, 4),
+                                      Fraction(0, 2), Fraction(-1, 4)),
+                           "f(x) = 1/10*x^3 + 7/4*x^2 - 1/4"),
+                          (Polynomial(Fraction(5, 7), 0, 0, Fraction(-1),
+                                      Fraction(-1, 3), Fraction(19, 1)),
+                           "f(x) = 5/7*x^5 - x^2 - 1/3*x + 19")])
+def test_write_ascii(p: Polynomial, s: str) -> None:
+    file = io.StringIO()
+    p.write(file, ascii=True)
+    assert file.getvalue() == s
+
+
+def test_write_chunked() -> None:
+    p = Polynomial(*range(1, 5000))
+    file = io.StringIO()
+    p.write(file)
+    assert file.getvalue() == str(p)
@@ -42,3 +42,27 @@ def test_eval_int_coeffs(f: Polynomial, x: Complex, fx: Complex) -> None:
                                              Fraction(579, 320))])
 def test_eval_rational_coeffs(f: Polynomial, x: Complex, fx: Complex) -> None:
     assert f(x) == fx
+
+
+@pytest.mark.parametrize("f", [Polynomial(),
+                               Polynomial(-8),
+                               Polynomial(Fraction(-8)),
+                               Polynomial(Fraction(3, 7)),
+                               Polynomial(1, -8),
+                               Polynomial(Fraction(2), -8),
+                               Polynomial(-1, 17, 0, 3),
+                               Polynomial(2, 0, 0, 0, -5, -9),
+                               Polynomial(-1, Fraction(173, 2), 0,
+                                          Fraction(37, 4)),
+                               Polynomial(Fraction(25, 2), 0, 0, 0,
+                                          Fraction(-26, 5), Fraction(-2, 5))])
+def test_eval_at(f: Polynomial) -> None:
+    points = [0, 4, -7, Fraction(-1, 2), Fraction(6, 3), Fraction(22, 7),
+              0.25]
+    res = f.eval_at(points)
+    assert res == [f(x) for x in points]
+    assert [type(fx) for fx in res] == [type(f(x)) for x in points]
+
+
+def test_eval_at_no_points() -> None:
+    assert Polynomial(1, 2).eval_at([]) == []
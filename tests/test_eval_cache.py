@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright:   (c) 2023 ff. Michael Amrhein (michael@adrhinum.de)
+# License:     This program is part of a larger application. For license
+#              details please read the file LICENSE.TXT provided together
+#              with the application.
+# ----------------------------------------------------------------------------
+# $Source$
+# $Revision$
+
+
+"""Test caching of evaluations."""
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+
+import pytest
+
+from polynomial import EvalCache, Polynomial
+
+
+@pytest.mark.parametrize(("maxsize", "exc"), [(-1, ValueError),
+                                              (2.0, TypeError)])
+def test_init_invalid(maxsize: int, exc: type) -> None:
+    with pytest.raises(exc):
+        EvalCache(maxsize)
+
+
+def test_hits_and_misses() -> None:
+    cache = EvalCache(maxsize=10)
+    f = Polynomial(-1, Fraction(173, 2), 0, Fraction(37, 4))
+    g = Polynomial(-1, Fraction(173, 2), 0, Fraction(37, 4))
+    assert cache.eval(f, 4) == Fraction(5317, 4)
+    assert cache(g, 4) == Fraction(5317, 4)
+    assert cache.eval(f, Fraction(4)) == Fraction(5317, 4)
+    assert cache.cache_info() == (1, 2, 10, 2)
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 10, 0)
+
+
+class CountingFraction(Fraction):
+    n_hashed = 0
+
+    def __hash__(self) -> int:
+        CountingFraction.n_hashed += 1
+        return super().__hash__()
+
+
+def test_hit_does_not_rehash_polynomial() -> None:
+    cache = EvalCache()
+    f = Polynomial(*(CountingFraction(i, 7) for i in range(1, 201)))
+    cache.eval(f, 3)
+    n_hashed = CountingFraction.n_hashed
+    assert n_hashed == 200
+    for _ in range(10):
+        cache.eval(f, 3)
+    assert CountingFraction.n_hashed == n_hashed
+    assert cache.cache_info().hits == 10
+
+
+def test_lru_eviction() -> None:
+    cache = EvalCache(maxsize=2)
+    f = Polynomial(1, 0, -1)
+    cache.eval(f, 1)
+    cache.eval(f, 2)
+    cache.eval(f, 1)
+    cache.eval(f, 3)        # evicts 2
+    assert len(cache) == 2
+    cache.eval(f, 1)
+    cache.eval(f, 2)
+    assert cache.cache_info() == (2, 4, 2, 2)
+
+
+@pytest.mark.parametrize(("maxsize", "currsize"), [(0, 0), (None, 100)])
+def test_maxsize(maxsize: int, currsize: int) -> None:
+    cache = EvalCache(maxsize)
+    f = Polynomial(2, 0, 0, 0, -5, -9)
+    for x in range(100):
+        assert cache.eval(f, x) == f(x)
+    assert cache.cache_info() == (0, 100, maxsize, currsize)
+
+
+def test_threads() -> None:
+    cache = EvalCache(maxsize=50)
+    polys = [Polynomial(i, 1, -7) for i in range(1, 5)]
+
+    def work(i: int) -> bool:
+        f = polys[i % 4]
+        return all(cache.eval(f, x) == f(x) for x in range(-40, 40))
+
+    with ThreadPoolExecutor(8) as pool:
+        assert all(pool.map(work, range(32)))
+    hits, misses, maxsize, currsize = cache.cache_info()
+    assert hits + misses == 32 * 80
+    assert currsize == maxsize
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright:   (c) 2023 ff. Michael Amrhein (michael@adrhinum.de)
+# License:     This program is part of a larger application. For license
+#              details please read the file LICENSE.TXT provided together
+#              with the application.
+# ----------------------------------------------------------------------------
+# $Source$
+# $Revision$
+
+
+"""Test factorization of polynomials."""
+from fractions import Fraction
+
+import pytest
+
+from polynomial import Polynomial
+
+
+@pytest.mark.parametrize(("f", "c"), [(Polynomial(), 0),
+                                      (Polynomial(7), 7),
+                                      (Polynomial(Fraction(-2, 3)),
+                                       Fraction(-2, 3))])
+def test_factor_constant(f: Polynomial, c: int) -> None:
+    assert f.factor() == (c, ())
+
+
+@pytest.mark.parametrize(("f", "factors"), [
+    (Polynomial(2, -2, -4),
+     (2, ((Polynomial(1, -2), 1), (Polynomial(1, 1), 1)))),
+    (Polynomial(Fraction(1, 2), 0, -1, 0),
+     (Fraction(1, 2), ((Polynomial(1, 0), 1), (Polynomial(1, 0, -2), 1)))),
+    (Polynomial(-4, 0, 3, 0, 0, 0, 0),
+     (-1, ((Polynomial(1, 0), 4), (Polynomial(4, 0, -3), 1)))),
+    (Polynomial(4, -12, 9),
+     (1, ((Polynomial(2, -3), 2),))),
+    (Polynomial(6, 1, -1),
+     (1, ((Polynomial(2, 1), 1), (Polynomial(3, -1), 1)))),
+    (Polynomial(1, 0, 0, -2),
+     (1, ((Polynomial(1, 0, 0, -2), 1),))),
+    (Polynomial(1, 0, 0, 0, 1),
+     (1, ((Polynomial(1, 0, 0, 0, 1), 1),))),
+    (Polynomial(1, 0, -40, 0, 352, 0, -960, 0, 576),
+     (1, ((Polynomial(1, 0, -40, 0, 352, 0, -960, 0, 576), 1),))),
+    (Polynomial(1, *([0] * 11), -1),
+     (1, ((Polynomial(1, -1), 1), (Polynomial(1, 1), 1),
+          (Polynomial(1, -1, 1), 1), (Polynomial(1, 0, 1), 1),
+          (Polynomial(1, 1, 1), 1), (Polynomial(1, 0, -1, 0, 1), 1)))),
+])
+def test_factor(f: Polynomial, factors: tuple) -> None:
+    assert f.factor() == factors
+
+
+@pytest.mark.parametrize("factors", [
+    ((Polynomial(10007, 20011), 1), (Polynomial(30011, -1, 10009), 1)),
+    ((Polynomial(3, 0, 0, 1, 1), 2), (Polynomial(1, 0, 0, 1, 0, 0, 1), 1),
+     (Polynomial(5, 14, 0, -28, 7), 3)),
+    ((Polynomial(7, 0, 404, 202, 0, 0, 606), 1),
+     (Polynomial(37, 6, 12, 0, 3, 9, 3, 0, -6), 1),
+     (Polynomial(1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2), 2)),
+])
+def test_factor_product(factors: tuple) -> None:
+    f = Polynomial(Fraction(-3, 7))
+    for g, e in factors:
+        for _ in range(e):
+            f *= g
+    c, res = f.factor()
+    assert c == Fraction(-3, 7)
+    assert sorted(res, key=lambda item: item[0]._coeffs) == \
+           sorted(factors, key=lambda item: item[0]._coeffs)
+
+
+def test_factor_cached() -> None:
+    f = Polynomial(1, 0, -1)
+    assert f.factor() is f.factor()
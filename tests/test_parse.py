@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright:   (c) 2023 ff. Michael Amrhein (michael@adrhinum.de)
+# License:     This program is part of a larger application. For license
+#              details please read the file LICENSE.TXT provided together
+#              with the application.
+# ----------------------------------------------------------------------------
+# $Source$
+# $Revision$
+
+
+"""Test conversions from strings."""
+import io
+from fractions import Fraction
+
+import pytest
+
+from polynomial import Polynomial
+
+
+@pytest.mark.parametrize("p", [Polynomial(),
+                               Polynomial(-238),
+                               Polynomial(7, -3),
+                               Polynomial(5, 0, 0, -1, -1, 19),
+                               Polynomial(Fraction(-23, 8)),
+                               Polynomial(Fraction(1, 10), Fraction(7, 4),
+                                          Fraction(0, 2), Fraction(-1, 4)),
+                               Polynomial(Fraction(5, 7), 0, 0, Fraction(-1),
+                                          Fraction(-1, 3), Fraction(19, 1)),
+                               Polynomial(*range(-50, 0))])
+def test_round_trip(p: Polynomial) -> None:
+    assert Polynomial.parse(str(p)) == p
+    file = io.StringIO()
+    p.write(file, ascii=True)
+    assert Polynomial.parse(file.getvalue()) == p
+
+
+@pytest.mark.parametrize(("s", "p"),
+                         [("0", Polynomial()),
+                          ("-x", Polynomial(-1, 0)),
+                          ("g(x) = 2x**10", Polynomial(2, *([0] * 10))),
+                          ("3 - x^2 + 2 * x ^ 2", Polynomial(1, 0, 3)),
+                          ("1/2x**3 - 7x + 4",
+                           Polynomial(Fraction(1, 2), 0, -7, 4)),
+                          ("1.25x - 0.5", Polynomial(Fraction(5, 4),
+                                                     Fraction(-1, 2))),
+                          ("x - x", Polynomial()),
+                          ("  f(x)=x³+¹/₂⋅x  ", Polynomial(1, 0,
+                                                           Fraction(1, 2),
+                                                           0))])
+def test_parse(s: str, p: Polynomial) -> None:
+    assert Polynomial.parse(s) == p
+
+
+@pytest.mark.parametrize(("s", "r"), [("4/2", "Polynomial(2)"),
+                                      ("1.", "Polynomial(1)"),
+                                      ("1/2x + 1/2x", "Polynomial(1, 0)"),
+                                      ("2.50x - ⁶/₃", "Polynomial("
+                                                    "Fraction(5, 2), -2)")])
+def test_parse_int_coeffs(s: str, r: str) -> None:
+    assert repr(Polynomial.parse(s)) == r
+
+
+@pytest.mark.parametrize("s", ["", "f(x) = ", "y", "x x", "2 3", "*x", "^2",
+                               "x^", "1/", "x + ", "1/0", "1/0*x",
+                               "x + ¹/₀⋅x²"])
+def test_parse_invalid(s: str) -> None:
+    with pytest.raises(ValueError):
+        Polynomial.parse(s)
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright:   (c) 2023 ff. Michael Amrhein (michael@adrhinum.de)
+# License:     This program is part of a larger application. For license
+#              details please read the file LICENSE.TXT provided together
+#              with the application.
+# ----------------------------------------------------------------------------
+# $Source$
+# $Revision$
+
+
+"""Test truncated power series."""
+from fractions import Fraction
+from math import factorial
+
+import pytest
+
+from polynomial import Polynomial, PowerSeries
+
+X = PowerSeries(Polynomial(1, 0), 40)
+
+
+@pytest.mark.parametrize(("f", "prec", "coeffs"),
+                         [(Polynomial(), 5, Polynomial()),
+                          (Polynomial(1, 7, 0, 4), 0, Polynomial()),
+                          (Polynomial(1, 7, 0, 4), 2, Polynomial(4)),
+                          (Polynomial(1, 7, 0, 4), 3, Polynomial(7, 0, 4)),
+                          (Polynomial(1, 7, 0, 4), 9, Polynomial(1, 7, 0, 4)),
+                          (Fraction(-3, 2), 2, Polynomial(Fraction(-3, 2)))])
+def test_init(f: Polynomial, prec: int, coeffs: Polynomial) -> None:
+    s = PowerSeries(f, prec)
+    assert s.precision == prec
+    assert s.polynomial == coeffs
+
+
+@pytest.mark.parametrize(("f", "prec", "exc"),
+                         [("1", 2, TypeError),
+                          (Polynomial(1), 2.0, TypeError),
+                          (Polynomial(1), -1, ValueError)])
+def test_init_invalid(f: Polynomial, prec: int, exc: type) -> None:
+    with pytest.raises(exc):
+        PowerSeries(f, prec)
+
+
+@pytest.mark.parametrize(("s", "r"), [
+    (PowerSeries(Polynomial(), 3), "f(x) = O(x³)"),
+    (PowerSeries(Polynomial(3, -2), 0), "f(x) = O(1)"),
+    (PowerSeries(Polynomial(3, -2), 1), "f(x) = -2 + O(x)"),
+    (PowerSeries(Polynomial(Fraction(-1, 2), 1, 0), 12),
+     "f(x) = x - ¹/₂⋅x² + O(x¹²)")])
+def test_str(s: PowerSeries, r: str) -> None:
+    assert str(s) == r
+
+
+def test_arithmetic() -> None:
+    s = PowerSeries(Polynomial(1, 2, 3), 5)
+    t = PowerSeries(Polynomial(1, 0, 0, 0, -1, 1), 4)
+    assert s + t == PowerSeries(Polynomial(1, 1, 4), 4)
+    assert s - t == PowerSeries(Polynomial(1, 3, 2), 4)
+    assert s - 3 == PowerSeries(Polynomial(1, 2, 0), 5)
+    assert 1 - s == PowerSeries(Polynomial(-1, -2, -2), 5)
+    assert s * t == PowerSeries(Polynomial(-1, -1, -1, 3), 4)
+    assert s * Polynomial(1, 0) == PowerSeries(Polynomial(1, 2, 3, 0), 5)
+    assert 2 * s == PowerSeries(Polynomial(2, 4, 6), 5)
+    assert s / 2 == PowerSeries(Polynomial(Fraction(1, 2), 1,
+                                           Fraction(3, 2)), 5)
+    assert (s / t) * t == s * PowerSeries(1, 4)
+
+
+def test_inverse() -> None:
+    s = 1 - X
+    assert s.inverse() == PowerSeries(Polynomial(*([1] * 40)), 40)
+    s = PowerSeries(Polynomial(Fraction(1, 3), -7, 0, 5, Fraction(2, 5)), 40)
+    assert s * s.inverse() == PowerSeries(1, 40)
+    with pytest.raises(ZeroDivisionError):
+        X.inverse()
+
+
+@pytest.mark.parametrize(("s", "r"), [
+    (PowerSeries(Polynomial(1, 2, 1), 6).sqrt(),
+     "PowerSeries(Polynomial(1, 1), 6)"),
+    (PowerSeries(4, 3).sqrt(), "PowerSeries(Polynomial(2), 3)"),
+    (PowerSeries(Polynomial(2, 0), 3).integral(),
+     "PowerSeries(Polynomial(1, 0, 0), 4)")])
+def test_int_coeffs(s: PowerSeries, r: str) -> None:
+    assert repr(s) == r
+
+
+def test_precision_zero() -> None:
+    s = PowerSeries(Polynomial(1, 1), 0)
+    assert s.inverse() == s
+    assert s.log() == s
+    assert s.exp() == s
+    assert s.sqrt() == s
+
+
+def test_derivative_integral() -> None:
+    s = PowerSeries(Polynomial(Fraction(1, 3), -7, 0, 5, Fraction(2, 5)), 4)
+    assert s.derivative() == PowerSeries(Polynomial(-21, 0, 5), 3)
+    assert s.integral() == PowerSeries(Polynomial(Fraction(-7, 4), 0,
+                                                  Fraction(5, 2),
+                                                  Fraction(2, 5), 0), 5)
+    assert s.integral().derivative() == s
+
+
+def test_exp_log() -> None:
+    e = X.exp()
+    assert e == PowerSeries(Polynomial(*(Fraction(1, factorial(k))
+                                         for k in range(39, -1, -1))), 40)
+    assert e.log() == X
+    s = 1 + X * Fraction(3, 7) - X * X * X
+    assert s.log().exp() == s
+    assert s.log() * 2 == (s * s).log()
+    with pytest.raises(ValueError):
+        s.exp()
+    with pytest.raises(ValueError):
+        X.log()
+
+
+def test_sqrt() -> None:
+    s = PowerSeries(Polynomial(Fraction(1, 9), -3, 4), 40)
+    r = s.sqrt()
+    assert r * r == s
+    assert r.polynomial.eval(0) == 2
+    assert (1 + 4 * X).sqrt() == PowerSeries(Polynomial(*(
+        (-1) ** (k + 1) * 2 * factorial(2 * k - 2) //
+        (factorial(k) * factorial(k - 1))
+        for k in range(39, 0, -1)), 1), 40)
+    with pytest.raises(ValueError):
+        (2 + X).sqrt()
+    with pytest.raises(ValueError):
+        (-1 + X).sqrt()
+
+
+def test_polynomial_lhs() -> None:
+    f = Polynomial(1, 1)
+    s = PowerSeries(Polynomial(1, 2, 3), 2)
+    assert f + s == PowerSeries(Polynomial(3, 4), 2)
+    assert f - s == PowerSeries(Polynomial(-1, -2), 2)
+    assert f * s == PowerSeries(Polynomial(5, 3), 2)
+    assert f / s == PowerSeries(Polynomial(Fraction(1, 9), Fraction(1, 3)),
+                                2)
+
+
+@pytest.mark.parametrize("other", ["1", 1.5, None])
+def test_polynomial_invalid_operand(other: object) -> None:
+    f = Polynomial(1, 1)
+    with pytest.raises(TypeError):
+        f + other
+    with pytest.raises(TypeError):
+        f - other
+    with pytest.raises(TypeError):
+        f * other
+
+
+def test_compare_with_polynomial() -> None:
+    f = Polynomial(1, 2)
+    s = PowerSeries(f, 5)
+    assert f != s
+    assert s != f
+    assert not f == s
+    assert not s == f
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright:   (c) 2023 ff. Michael Amrhein (michael@adrhinum.de)
+# License:     This program is part of a larger application. For license
+#              details please read the file LICENSE.TXT provided together
+#              with the application.
+# ----------------------------------------------------------------------------
+# $Source$
+# $Revision$
+
+
+"""Test modular reduction of polynomials."""
+from fractions import Fraction
+
+import pytest
+
+from polynomial import Polynomial
+
+
+def test_zero_modulus() -> None:
+    with pytest.raises(ZeroDivisionError):
+        Polynomial().reducer()
+
+
+@pytest.mark.parametrize(("f", "m"), [
+    (Polynomial(), Polynomial(2, 1)),
+    (Polynomial(3, 1), Polynomial(1, 0, 1)),
+    (Polynomial(1, 7, 0, 4), Polynomial(Fraction(3), Fraction(-1, 2))),
+    (Polynomial(Fraction(5, 7), 0, 0, -1, Fraction(-1, 3), 19),
+     Polynomial(Fraction(-2), 0, 5)),
+    (Polynomial(*range(1, 60)),
+     Polynomial(Fraction(3), Fraction(-1, 2), 0, 0, 7, 1)),
+])
+def test_reduce(f: Polynomial, m: Polynomial) -> None:
+    assert m.reducer().reduce(f) == f % m
+
+
+def test_reduce_by_constant() -> None:
+    assert Polynomial(3).reducer().reduce(Polynomial(1, 7, 0, 4)) == \
+           Polynomial()
+
+
+@pytest.mark.parametrize(("f", "g", "m"), [
+    (Polynomial(1, 1), Polynomial(1, 0, 0), Polynomial(1, 0, 0, -1)),
+    (Polynomial(Fraction(5, 7), 0, Fraction(-1, 3), 19),
+     Polynomial(Fraction(2, 3), 0, 1), Polynomial(Fraction(-2), 0, 1, 5)),
+])
+def test_mulmod(f: Polynomial, g: Polynomial, m: Polynomial) -> None:
+    assert m.reducer().mulmod(f, g) == f * g % m
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 7, 16, 25])
+def test_powmod(n: int) -> None:
+    m = Polynomial(Fraction(-2), 0, 1, 5)
+    f = Polynomial(Fraction(5, 7), 0, Fraction(-1, 3), 19)
+    p = Polynomial(1)
+    for _ in range(n):
+        p = p * f % m
+    assert m.reducer().powmod(f, n) == p
+
+
+@pytest.mark.parametrize(("m", "res"), [
+    (Polynomial(1, 0, 1), Polynomial(1)),
+    (Polynomial(1, 0, 0, -1), Polynomial(1, 0)),
+    (Polynomial(1, 0, 0, 0, 0, -1), Polynomial(1, 0)),
+    (Polynomial(1), Polynomial()),
+])
+def test_powmod_huge_exponent(m: Polynomial, res: Polynomial) -> None:
+    assert m.reducer().powmod(Polynomial(1, 0), 2 ** 64) == res
+
+
+def test_powmod_negative_exponent() -> None:
+    with pytest.raises(ValueError):
+        Polynomial(1, 0, 1).reducer().powmod(Polynomial(1, 0), -1)